@@ -0,0 +1,10 @@
+# Makes `server` importable when pytest runs from the repo root.
+import pytest
+
+from server import config
+
+
+@pytest.fixture(autouse=True)
+def _catalog_cache_dir(tmp_path, monkeypatch):
+    # Keep the precompiled catalog out of the working tree during tests
+    monkeypatch.setattr(config, "CATALOG_CACHE_DIR", str(tmp_path / "catalog-cache"))
@@ -3,6 +3,7 @@ from socketio import ASGIApp
 from starlette.staticfiles import StaticFiles
 
 from .extensions import socketio
+from .health import health_prober
 from .routes import register_routes
 from .sockets import register_socket_handlers
 
@@ -17,6 +18,9 @@ def create_app():
     register_routes(app)
     register_socket_handlers(app)
 
+    # Keep Dynamic task health fresh so dead services are never spun
+    socketio.start_background_task(health_prober.run)
+
     # Wrap FastAPI with Socket.IO ASGI app
     asgi_app = ASGIApp(socketio, other_asgi_app=app)
 
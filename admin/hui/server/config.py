@@ -1,12 +1,24 @@
+import hashlib
 import json
+import marshal
+import os
 from pathlib import Path
 
+from .models import Task
+
 CONFIG_PATH = "config/tasks.json"
 STATIC_FILES_DIR = "static_files"
 
+# Precompiled catalog lives outside config/, which is usually bind-mounted
+CATALOG_CACHE_DIR = os.environ.get("CATALOG_CACHE_DIR", ".cache")
+CATALOG_CACHE_VERSION = 3
+
 
 TIMER_CONFIG = {"max_time": 300, "warning_threshold": 60}
 
+# Dynamic task link probing (seconds)
+HEALTH_CONFIG = {"interval": 30.0, "timeout": 3.0, "max_connections": 20}
+
 # Basic Auth users (username -> password)
 BASIC_USERS = {
     "master": "master123",
@@ -16,15 +28,90 @@ BASIC_USERS = {
 }
 
 
-def load_tasks(config_path: str) -> list:
+def _catalog_cache_path(config_path: str, cache_dir: str) -> Path:
+    key = hashlib.sha256(os.path.abspath(config_path).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"catalog-{key}.bin"
+
+
+def _read_catalog_cache(path: Path) -> tuple[int, int, bytes, list[Task]] | None:
+    try:
+        with open(path, "rb") as f:
+            version, size, mtime_ns, digest, rows = marshal.loads(f.read())
+        if version != CATALOG_CACHE_VERSION:
+            return None
+        return size, mtime_ns, digest, [Task(*row) for row in rows]
+    except Exception:
+        return None
+
+
+def _write_catalog_cache(
+    path: Path, st: os.stat_result, digest: bytes, tasks: list[Task]
+) -> None:
+    rows = tuple(task.as_tuple() for task in tasks)
+    payload = (CATALOG_CACHE_VERSION, st.st_size, st.st_mtime_ns, digest, rows)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(marshal.dumps(payload))
+    except OSError as e:
+        print(f"Could not write catalog cache: {e}")
+
+
+def _parse_tasks(source: bytes) -> list[Task]:
+    raw_tasks = json.loads(source).get("tasks", [])
+    tasks: list[Task] = []
+    for raw in raw_tasks:
+        try:
+            tasks.append(Task.from_dict(len(tasks), raw))
+        except ValueError as e:
+            print(f"Skipping task: {e}")
+    return tasks
+
+
+def load_tasks(config_path: str, cache_dir: str | None = None) -> list[Task]:
+    """
+    Load the task catalog, going through a precompiled marshal cache.
+
+    The cache records the source's size, mtime and SHA-256. When size and
+    mtime still match, startup is a stat of tasks.json plus a single read of
+    the cache. Otherwise tasks.json is read and hashed: an unchanged hash
+    (e.g. the file was only touched) keeps the cached tasks, a new hash
+    reparses the JSON. Either way the cache is rewritten. It is stored under
+    CATALOG_CACHE_DIR (default .cache/, relative to the working directory)
+    so the bind-mounted config/ directory is never written to.
+    """
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            return config.get("tasks", [])
+        st = os.stat(config_path)
     except Exception as e:
         print(f"Error loading config: {e}")
         return []
 
+    cache_path = _catalog_cache_path(config_path, cache_dir or CATALOG_CACHE_DIR)
+    cached = _read_catalog_cache(cache_path)
+    if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return cached[3]
+
+    try:
+        with open(config_path, "rb") as f:
+            source = f.read()
+            st = os.fstat(f.fileno())
+    except Exception as e:
+        print(f"Error loading config: {e}")
+        return []
+
+    digest = hashlib.sha256(source).digest()
+    if cached is not None and cached[2] == digest:
+        tasks = cached[3]
+    else:
+        try:
+            tasks = _parse_tasks(source)
+        except Exception as e:
+            print(f"Error loading config: {e}")
+            return []
+
+    _write_catalog_cache(cache_path, st, digest, tasks)
+    return tasks
+
 
 def safe_filename(filename: str) -> str:
     return Path(filename).name
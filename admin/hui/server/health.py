@@ -0,0 +1,107 @@
+import asyncio
+import time
+from typing import TypedDict
+
+import httpx
+
+from .clock import Clock, system_clock
+from .config import HEALTH_CONFIG
+from .models import Task
+from .task_manager import TaskManager, task_manager
+
+
+class TaskHealth(TypedDict):
+    healthy: bool
+    status_code: int | None
+    latency_ms: float | None
+    error: str | None
+    # wall-clock epoch seconds, published as-is in /api/tasks
+    checked_at: float
+
+
+class HealthProber:
+    """Periodically checks Dynamic tasks over a shared keep-alive pool.
+
+    Results are written to `TaskManager.task_health`; tasks whose last probe
+    failed are skipped by `spin_wheel`. Any HTTP response below 500 counts as
+    healthy, since the service is up even if `/` is not a real page.
+
+    `link` is the player-facing URL and is often wrong from inside the admin
+    container (e.g. `http://localhost:3000`). Set the task's optional `probe`
+    field in tasks.json to a URL reachable from the admin host, such as
+    `http://host.docker.internal:3000`; without it `link` is probed.
+    """
+
+    def __init__(
+        self,
+        manager: TaskManager = task_manager,
+        clock: Clock = system_clock,
+        interval: float = HEALTH_CONFIG["interval"],
+        timeout: float = HEALTH_CONFIG["timeout"],
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.manager = manager
+        self.clock = clock
+        self.interval = interval
+        self.timeout = timeout
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=int(HEALTH_CONFIG["max_connections"]),
+                    max_keepalive_connections=int(HEALTH_CONFIG["max_connections"]),
+                ),
+                follow_redirects=False,
+            )
+        return self._client
+
+    async def probe(self, task: Task) -> TaskHealth:
+        started = self.clock.now()
+        try:
+            response = await self.client.get(task.probe_url)
+            await response.aclose()
+        except Exception as e:
+            return {
+                "healthy": False,
+                "status_code": None,
+                "latency_ms": None,
+                "error": f"{type(e).__name__}: {e}" if str(e) else type(e).__name__,
+                "checked_at": time.time(),
+            }
+        return {
+            "healthy": response.status_code < 500,
+            "status_code": response.status_code,
+            "latency_ms": round((self.clock.now() - started) * 1000, 1),
+            "error": None,
+            "checked_at": time.time(),
+        }
+
+    async def probe_all(self) -> dict[int, TaskHealth]:
+        dynamic = [task for task in self.manager.tasks if task.type == "Dynamic"]
+        results = await asyncio.gather(*(self.probe(task) for task in dynamic))
+        health = {task.id: result for task, result in zip(dynamic, results)}
+        self.manager.task_health = health
+        return health
+
+    async def run(self) -> None:
+        while True:
+            try:
+                health = await self.probe_all()
+                down = [tid for tid, h in health.items() if not h["healthy"]]
+                if down:
+                    print(f"Unhealthy dynamic tasks: {down}")
+            except Exception as e:
+                print(f"Error in health prober: {e}")
+            await self.clock.sleep(self.interval)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+health_prober = HealthProber()
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import Any
+
+TASK_TYPES = ("Static", "Dynamic")
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    id: int
+    name: str
+    category: str
+    link: str
+    type: str
+    secret: str
+    # URL the health prober checks instead of `link`; "" means probe `link`
+    probe: str = ""
+
+    @classmethod
+    def from_dict(cls, task_id: int, raw: Any) -> "Task":
+        if not isinstance(raw, dict):
+            raise ValueError(f"task #{task_id} is not an object")
+        fields: dict[str, str] = {}
+        for key in ("name", "category", "link", "type", "secret"):
+            value = raw.get(key)
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"task #{task_id} has invalid '{key}'")
+            fields[key] = value
+        if fields["type"] not in TASK_TYPES:
+            raise ValueError(f"task #{task_id} has unknown type '{fields['type']}'")
+        probe = raw.get("probe", "")
+        if not isinstance(probe, str):
+            raise ValueError(f"task #{task_id} has invalid 'probe'")
+        return cls(id=task_id, probe=probe, **fields)
+
+    @property
+    def probe_url(self) -> str:
+        return self.probe or self.link
+
+    def as_tuple(self) -> tuple[int, str, str, str, str, str, str]:
+        return (
+            self.id,
+            self.name,
+            self.category,
+            self.link,
+            self.type,
+            self.secret,
+            self.probe,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "category": self.category,
+            "link": self.link,
+            "type": self.type,
+            "secret": self.secret,
+        }
@@ -47,18 +47,18 @@ def register_routes(app: FastAPI) -> None:
 
     @app.get("/api/tasks")
     def get_tasks():
-        return JSONResponse(task_manager.tasks)
+        return JSONResponse(task_manager.tasks_payload())
 
     @app.get("/api/current-task")
     def get_current_task():
-        return JSONResponse(task_manager.current_task or {})
+        return JSONResponse(task_manager.current_task_payload() or {})
 
     @app.get("/api/game-state")
     def get_game_state():
         return JSONResponse(
             {
                 "game_state": task_manager.game_state,
-                "current_task": task_manager.current_task,
+                "current_task": task_manager.current_task_payload(),
                 "slave_solutions": task_manager.slave_solutions,
                 "player_names": task_manager.player_names,
                 "used_indices": list(task_manager.used_tasks),
@@ -89,7 +89,7 @@ def register_routes(app: FastAPI) -> None:
             "game_state_update",
             {
                 "game_state": task_manager.game_state,
-                "current_task": task_manager.current_task,
+                "current_task": task_manager.current_task_payload(),
                 "slave_solutions": task_manager.slave_solutions,
                 "player_names": task_manager.player_names,
             },
@@ -103,8 +103,8 @@ def register_routes(app: FastAPI) -> None:
 
         if (
             task_manager.current_task
-            and task_manager.current_task.get("type") == "Static"
-            and task_manager.current_task.get("link") == filename
+            and task_manager.current_task.type == "Static"
+            and task_manager.current_task.link == filename
         ):
             if os.path.exists(file_path):
                 return FileResponse(file_path, filename=filename_only)
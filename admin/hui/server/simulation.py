@@ -0,0 +1,144 @@
+"""Replay game rounds against a simulated clock.
+
+Usage: python -m server.simulation --rounds 5000 --seed 1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import time
+from typing import Any
+
+from .clock import SimulatedClock
+from .config import CONFIG_PATH, TIMER_CONFIG
+from .task_manager import TaskManager
+from .timer import TimerStore
+
+SLAVE_IDS = (1, 2)
+
+
+async def simulate(
+    rounds: int,
+    seed: int = 0,
+    config_path: str = CONFIG_PATH,
+    solve_rate: float = 0.005,
+    add_time_rate: float = 0.002,
+    max_round_ticks: int = 3600,
+) -> dict[str, Any]:
+    """Play `rounds` rounds, advancing virtual time one second per tick.
+
+    Each tick a slave may solve the task (`solve_rate`) or the master may
+    add 30 seconds to a running timer (`add_time_rate`). Round outcomes go
+    through the same TaskManager/TimerStore methods the socket handlers use,
+    and the real `TimerStore.tick_forever` loop runs as the broadcaster.
+
+    A round still active after `max_round_ticks` ticks is stopped and counted
+    as "capped"; with a high `add_time_rate` the timers could otherwise be
+    topped up faster than they run down.
+    """
+    rng = random.Random(seed)
+    clock = SimulatedClock()
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = TaskManager(config_path, rng=random.Random(seed))
+    timers = TimerStore(clock)
+
+    stats: dict[str, Any] = {
+        "rounds": 0,
+        "completed": 0,
+        "expired": 0,
+        "capped": 0,
+        "solves": 0,
+        "add_time": 0,
+        "broadcasts": 0,
+        "virtual_seconds": 0.0,
+    }
+
+    async def _broadcast() -> None:
+        timers.snapshot()
+        stats["broadcasts"] += 1
+
+    broadcaster = asyncio.create_task(timers.tick_forever(_broadcast))
+    await asyncio.sleep(0)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(rounds):
+                task, task_index = manager.spin_wheel()
+                if task is None or task_index is None:
+                    break
+                manager.start_round(task_index)
+                timers.start_for_both()
+                stats["rounds"] += 1
+
+                for _ in range(max_round_ticks):
+                    if manager.game_state != "active":
+                        break
+                    clock.advance(1)
+                    await asyncio.sleep(0)
+
+                    for slave_id in SLAVE_IDS:
+                        if rng.random() < add_time_rate and timers.add_time(
+                            slave_id, 30
+                        ):
+                            stats["add_time"] += 1
+                        if (
+                            manager.game_state == "active"
+                            and not manager.slave_solutions[slave_id]
+                            and timers.slave_timers[slave_id]["running"]
+                            and rng.random() < solve_rate
+                        ):
+                            stats["solves"] += 1
+                            if manager.mark_solved(slave_id):
+                                timers.stop_all()
+                                stats["completed"] += 1
+
+                    # what clients polling get_timer_state trigger
+                    if manager.expire_if_timed_out(timers.snapshot()):
+                        stats["expired"] += 1
+                else:
+                    if manager.game_state == "active":
+                        timers.stop_all()
+                        manager.game_state = "completed"
+                        stats["capped"] += 1
+
+                timers.reset_all()
+    finally:
+        broadcaster.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await broadcaster
+
+    stats["virtual_seconds"] = clock.now()
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--solve-rate", type=float, default=0.005)
+    parser.add_argument("--add-time-rate", type=float, default=0.002)
+    parser.add_argument("--max-round-ticks", type=int, default=3600)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = asyncio.run(
+        simulate(
+            args.rounds,
+            seed=args.seed,
+            config_path=args.config,
+            solve_rate=args.solve_rate,
+            add_time_rate=args.add_time_rate,
+            max_round_ticks=args.max_round_ticks,
+        )
+    )
+    stats["max_time"] = TIMER_CONFIG["max_time"]
+    stats["wall_seconds"] = round(time.perf_counter() - started, 3)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
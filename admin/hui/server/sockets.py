@@ -1,5 +1,3 @@
-import asyncio
-
 from socketio import AsyncNamespace
 
 from .extensions import socketio
@@ -12,7 +10,7 @@ async def broadcast_game_state() -> None:
         "game_state_update",
         {
             "game_state": task_manager.game_state,
-            "current_task": task_manager.current_task,
+            "current_task": task_manager.current_task_payload(),
             "slave_solutions": task_manager.slave_solutions,
             "player_names": task_manager.player_names,
             "used_indices": list(task_manager.used_tasks),
@@ -33,7 +31,7 @@ class _TimerBroadcaster(AsyncNamespace):
             "game_state_update",
             {
                 "game_state": task_manager.game_state,
-                "current_task": task_manager.current_task,
+                "current_task": task_manager.current_task_payload(),
                 "slave_solutions": task_manager.slave_solutions,
                 "used_indices": list(task_manager.used_tasks),
                 "player_names": task_manager.player_names,
@@ -53,12 +51,12 @@ class _TimerBroadcaster(AsyncNamespace):
             if selected_task:
                 await socketio.emit(
                     "wheel_spinning",
-                    {"task": selected_task, "task_index": task_index},
+                    {"task": selected_task.to_dict(), "task_index": task_index},
                     room="master_clients",
                 )
                 return {
                     "success": True,
-                    "task": selected_task,
+                    "task": selected_task.to_dict(),
                     "task_index": task_index,
                 }
             else:
@@ -75,15 +73,10 @@ class _TimerBroadcaster(AsyncNamespace):
         task_index = data.get("task_index")
         print(f"Wheel stopped on task index: {task_index}")
 
-        if task_index is not None and task_index < len(task_manager.tasks):
-            task_manager.used_tasks.add(task_index)
-            task_manager.current_task = task_manager.tasks[task_index]
-            task_manager.game_state = "active"
-            task_manager.slave_solutions = {1: False, 2: False}
-
+        if task_index is not None and task_manager.start_round(task_index):
             timer_store.start_for_both()
 
-            print(f"Task marked as used: {task_manager.current_task['name']}")
+            print(f"Task marked as used: {task_manager.current_task.name}")
             print(
                 f"Used tasks count: {len(task_manager.used_tasks)}/{len(task_manager.tasks)}"
             )
@@ -95,14 +88,14 @@ class _TimerBroadcaster(AsyncNamespace):
             await socketio.emit(
                 "task_selected",
                 {
-                    "task": task_manager.current_task,
+                    "task": task_manager.current_task_payload(),
                     "used_count": len(task_manager.used_tasks),
                     "total_count": len(task_manager.tasks),
                     "used_indices": list(task_manager.used_tasks),
                 },
             )
             print(
-                f"Task selected event sent to players: {task_manager.current_task['name']}"
+                f"Task selected event sent to players: {task_manager.current_task.name}"
             )
         else:
             print(f"Invalid task index: {task_index}")
@@ -111,7 +104,7 @@ class _TimerBroadcaster(AsyncNamespace):
         await socketio.emit(
             "current_state",
             {
-                "current_task": task_manager.current_task,
+                "current_task": task_manager.current_task_payload(),
                 "used_count": len(task_manager.used_tasks),
                 "total_count": len(task_manager.tasks),
                 "game_state": task_manager.game_state,
@@ -147,20 +140,17 @@ class _TimerBroadcaster(AsyncNamespace):
 
         if (
             task_manager.current_task
-            and task_manager.current_task.get("secret") == submitted_secret
+            and task_manager.current_task.secret == submitted_secret
         ):
-            task_manager.slave_solutions[slave_id] = True
+            both_solved = task_manager.mark_solved(slave_id)
             print(f"Slave {slave_id} solved the task!")
 
-            await broadcast_game_state()
-
-            if all(task_manager.slave_solutions.values()):
+            if both_solved:
                 print("Both players solved the task! Stopping timers.")
-                for sid_itr in [1, 2]:
-                    timer_store.slave_timers[sid_itr]["running"] = False
+                timer_store.stop_all()
                 await broadcast_timer_state()
-                task_manager.game_state = "completed"
-                await broadcast_game_state()
+
+            await broadcast_game_state()
 
             return {"success": True, "message": "Correct secret!"}
         else:
@@ -189,14 +179,11 @@ class _TimerBroadcaster(AsyncNamespace):
     async def on_get_timer_state(self, sid):
         state = await broadcast_timer_state()
         # If both timers are not running and zero, ensure game is completed
-        if all(not t["running"] and t["remaining_time"] == 0 for t in state.values()):
-            if task_manager.game_state == "active":
-                task_manager.game_state = "completed"
-                await broadcast_game_state()
+        if task_manager.expire_if_timed_out(state):
+            await broadcast_game_state()
 
     async def on_stop_game(self, sid):
-        for sid_itr in [1, 2]:
-            timer_store.slave_timers[sid_itr]["running"] = False
+        timer_store.stop_all()
 
         task_manager.game_state = "completed"
         await broadcast_timer_state()
@@ -206,12 +193,7 @@ class _TimerBroadcaster(AsyncNamespace):
     async def on_cancel_round(self, sid):
         # Cancel the current round without marking task as used
         if task_manager.current_task is not None:
-            try:
-                idx = task_manager.tasks.index(task_manager.current_task)
-                if idx in task_manager.used_tasks:
-                    task_manager.used_tasks.discard(idx)
-            except ValueError:
-                pass
+            task_manager.used_tasks.discard(task_manager.current_task.id)
         task_manager.current_task = None
         task_manager.game_state = "waiting"
         task_manager.slave_solutions = {1: False, 2: False}
@@ -226,10 +208,4 @@ def register_socket_handlers(app) -> None:
     namespace = _TimerBroadcaster("/")
     socketio.register_namespace(namespace)
 
-    async def _loop():
-        while True:
-            await asyncio.sleep(1)
-            if any(t["running"] for t in timer_store.slave_timers.values()):
-                await broadcast_timer_state()
-
-    socketio.start_background_task(_loop)
+    socketio.start_background_task(timer_store.tick_forever, broadcast_timer_state)
@@ -1,15 +1,26 @@
 import random
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .config import CONFIG_PATH, load_tasks
+from .models import Task
+
+if TYPE_CHECKING:
+    from .health import TaskHealth
 
 
 class TaskManager:
-    def __init__(self, config_path: str = CONFIG_PATH):
+    def __init__(
+        self,
+        config_path: str = CONFIG_PATH,
+        rng: random.Random | None = None,
+    ):
         self.config_path = config_path
-        self.tasks: list[dict[str, Any]] = []
+        self.rng = rng or random.Random()
+        self.tasks: list[Task] = []
         self.used_tasks: set[int] = set()
-        self.current_task: dict[str, Any] | None = None
+        # task id -> last probe result, filled in by the health prober
+        self.task_health: dict[int, "TaskHealth"] = {}
+        self.current_task: Task | None = None
         self.game_state: str = "waiting"
         self.slave_solutions: dict[int, bool] = {1: False, 2: False}
         self.player_names: dict[int, str] = {1: "Player 1", 2: "Player 2"}
@@ -19,25 +30,68 @@ class TaskManager:
         self.tasks = load_tasks(self.config_path)
         print(f"Loaded {len(self.tasks)} tasks")
 
-    def get_available_tasks(self) -> list[dict[str, Any]]:
-        return [task for i, task in enumerate(self.tasks) if i not in self.used_tasks]
+    def is_healthy(self, task: Task) -> bool:
+        health = self.task_health.get(task.id)
+        return health is None or health["healthy"]
 
-    def spin_wheel(self) -> tuple[dict[str, Any] | None, int | None]:
-        available_tasks = self.get_available_tasks()
-        if not available_tasks:
+    def get_available_tasks(self) -> list[Task]:
+        return [
+            task
+            for task in self.tasks
+            if task.id not in self.used_tasks and self.is_healthy(task)
+        ]
+
+    def spin_wheel(self) -> tuple[Task | None, int | None]:
+        if self.tasks and len(self.used_tasks) >= len(self.tasks):
             self.used_tasks.clear()
-            available_tasks = self.tasks
             print("All tasks used, resetting...")
 
+        # Unused tasks that are currently down stay unused, not reset
+        available_tasks = self.get_available_tasks()
         if available_tasks:
-            selected_task = random.choice(available_tasks)
-            task_index = self.tasks.index(selected_task)
-            print(
-                f"Server selected task: {selected_task['name']} (index: {task_index})"
-            )
+            selected_task = self.rng.choice(available_tasks)
+            task_index = selected_task.id
+            print(f"Server selected task: {selected_task.name} (index: {task_index})")
             return selected_task, task_index
         return None, None
 
+    def start_round(self, task_index: int) -> bool:
+        if not 0 <= task_index < len(self.tasks):
+            return False
+        self.used_tasks.add(task_index)
+        self.current_task = self.tasks[task_index]
+        self.game_state = "active"
+        self.slave_solutions = {1: False, 2: False}
+        return True
+
+    def mark_solved(self, slave_id: int) -> bool:
+        """Record a correct secret; completes the round once both have solved."""
+        self.slave_solutions[slave_id] = True
+        if all(self.slave_solutions.values()):
+            self.game_state = "completed"
+            return True
+        return False
+
+    def expire_if_timed_out(
+        self, timer_state: dict[int, dict[str, int | bool]]
+    ) -> bool:
+        """Complete an active round once every timer has run out."""
+        if self.game_state == "active" and all(
+            not t["running"] and t["remaining_time"] == 0 for t in timer_state.values()
+        ):
+            self.game_state = "completed"
+            return True
+        return False
+
+    def tasks_payload(self) -> list[dict[str, Any]]:
+        return [
+            {**task.to_dict(), "health": self.task_health.get(task.id)}
+            for task in self.tasks
+        ]
+
+    def current_task_payload(self) -> dict[str, Any] | None:
+        return self.current_task.to_dict() if self.current_task else None
+
     def reset_game(self) -> None:
         self.used_tasks.clear()
         self.current_task = None
@@ -1,6 +1,6 @@
-import time
-from typing import TypedDict
+from typing import Awaitable, Callable, TypedDict
 
+from .clock import Clock, system_clock
 from .config import TIMER_CONFIG
 
 
@@ -11,7 +11,8 @@ class _TimerEntry(TypedDict):
 
 
 class TimerStore:
-    def __init__(self) -> None:
+    def __init__(self, clock: Clock = system_clock) -> None:
+        self.clock = clock
         self.slave_timers: dict[int, _TimerEntry] = {
             1: {
                 "start_time": None,
@@ -26,7 +27,7 @@ class TimerStore:
         }
 
     def start_for_both(self) -> None:
-        current_time = time.time()
+        current_time = self.clock.now()
         for slave_id in [1, 2]:
             self.slave_timers[slave_id]["start_time"] = current_time
             self.slave_timers[slave_id]["remaining_time"] = float(
@@ -41,6 +42,22 @@ class TimerStore:
                 TIMER_CONFIG["max_time"]
             )
 
+    def stop_all(self) -> None:
+        for slave_id in [1, 2]:
+            self.slave_timers[slave_id]["running"] = False
+
+    def any_running(self) -> bool:
+        return any(t["running"] for t in self.slave_timers.values())
+
+    async def tick_forever(
+        self, on_tick: Callable[[], Awaitable[object]], interval: float = 1.0
+    ) -> None:
+        """Call `on_tick` every `interval` clock seconds while a timer runs."""
+        while True:
+            await self.clock.sleep(interval)
+            if self.any_running():
+                await on_tick()
+
     def add_time(self, slave_id: int, seconds: int) -> bool:
         if slave_id in [1, 2] and self.slave_timers[slave_id]["running"]:
             self.slave_timers[slave_id]["remaining_time"] += seconds
@@ -49,7 +66,7 @@ class TimerStore:
 
     def snapshot(self) -> dict[int, dict[str, int | bool]]:
         timer_state: dict[int, dict[str, int | bool]] = {}
-        current_time = time.time()
+        current_time = self.clock.now()
 
         for slave_id, timer in self.slave_timers.items():
             start_time = timer["start_time"]
@@ -0,0 +1,106 @@
+import asyncio
+import json
+
+import pytest
+
+from server.clock import SimulatedClock
+from server.config import TIMER_CONFIG
+from server.simulation import simulate
+from server.task_manager import TaskManager
+from server.timer import TimerStore
+
+
+def _single_task_config(tmp_path) -> str:
+    config = tmp_path / "tasks.json"
+    task = {
+        "name": "Task",
+        "category": "Test",
+        "link": "http://127.0.0.1:1",
+        "type": "Static",
+        "secret": "s",
+    }
+    config.write_text(json.dumps({"tasks": [task]}))
+    return str(config)
+
+
+def test_sleepers_wake_in_deadline_order():
+    async def scenario():
+        clock = SimulatedClock()
+        woken: list[tuple[str, float]] = []
+
+        async def sleeper(name: str, seconds: float) -> None:
+            await clock.sleep(seconds)
+            woken.append((name, clock.now()))
+
+        tasks = [
+            asyncio.create_task(sleeper(name, seconds))
+            for name, seconds in (("c", 30), ("a", 10), ("b", 20), ("a2", 10))
+        ]
+        await asyncio.sleep(0)
+
+        clock.advance(15)
+        await asyncio.sleep(0)
+        assert [name for name, _ in woken] == ["a", "a2"]
+
+        clock.advance(100)
+        await asyncio.gather(*tasks)
+        assert [name for name, _ in woken] == ["a", "a2", "b", "c"]
+
+    asyncio.run(scenario())
+
+
+def test_advance_rejects_negative():
+    clock = SimulatedClock(start=5.0)
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+    assert clock.now() == 5.0
+
+
+def test_round_expires_after_max_time(tmp_path):
+    config = _single_task_config(tmp_path)
+
+    async def scenario():
+        clock = SimulatedClock()
+        manager = TaskManager(config)
+        timers = TimerStore(clock)
+        broadcasts: list[dict] = []
+        expired_at: list[float] = []
+
+        async def on_tick() -> None:
+            broadcasts.append(timers.snapshot())
+
+        ticker = asyncio.create_task(timers.tick_forever(on_tick))
+        await asyncio.sleep(0)
+        manager.start_round(0)
+        timers.start_for_both()
+
+        for _ in range(TIMER_CONFIG["max_time"] + 5):
+            clock.advance(1)
+            await asyncio.sleep(0)
+            # what clients polling get_timer_state trigger
+            if manager.expire_if_timed_out(timers.snapshot()):
+                expired_at.append(clock.now())
+
+        ticker.cancel()
+        return manager.game_state, broadcasts, expired_at
+
+    state, broadcasts, expired_at = asyncio.run(scenario())
+    assert state == "completed"
+    assert expired_at == [float(TIMER_CONFIG["max_time"])]
+    assert len(broadcasts) == TIMER_CONFIG["max_time"]
+    assert broadcasts[-1][1]["remaining_time"] == 0
+
+
+def test_simulate_caps_ticks_per_round(tmp_path):
+    config = _single_task_config(tmp_path)
+    stats = asyncio.run(
+        simulate(
+            3,
+            config_path=config,
+            solve_rate=0.0,
+            add_time_rate=1.0,
+            max_round_ticks=500,
+        )
+    )
+    assert stats["capped"] == 3
+    assert stats["virtual_seconds"] == 1500.0
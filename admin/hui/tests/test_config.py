@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+from server import config
+from server.config import load_tasks
+from server.models import Task
+
+RAW_TASK = {
+    "name": "Cookie",
+    "category": "Web",
+    "link": "http://localhost:8000",
+    "type": "Dynamic",
+    "secret": "s3cr3t",
+}
+
+
+def _write_catalog(path, names: list[str]) -> None:
+    tasks = [dict(RAW_TASK, name=name) for name in names]
+    path.write_text(json.dumps({"tasks": tasks}))
+
+
+def test_from_dict_builds_task():
+    task = Task.from_dict(3, RAW_TASK)
+    assert task.id == 3
+    assert task.to_dict() == dict(RAW_TASK, id=3)
+    assert task.probe_url == RAW_TASK["link"]
+
+    probed = Task.from_dict(0, dict(RAW_TASK, probe="http://cookie:8000"))
+    assert probed.probe_url == "http://cookie:8000"
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "not an object",
+        {k: v for k, v in RAW_TASK.items() if k != "secret"},
+        dict(RAW_TASK, name=""),
+        dict(RAW_TASK, link=42),
+        dict(RAW_TASK, type="Hybrid"),
+        dict(RAW_TASK, probe=["http://x"]),
+    ],
+)
+def test_from_dict_rejects_invalid(raw):
+    with pytest.raises(ValueError):
+        Task.from_dict(0, raw)
+
+
+def test_load_tasks_skips_invalid_entries(tmp_path):
+    source = tmp_path / "tasks.json"
+    source.write_text(json.dumps({"tasks": [RAW_TASK, {"name": "broken"}, RAW_TASK]}))
+    assert [t.id for t in load_tasks(str(source))] == [0, 1]
+
+
+def test_load_tasks_serves_unchanged_source_from_cache(tmp_path, monkeypatch):
+    source = tmp_path / "tasks.json"
+    _write_catalog(source, ["a", "b"])
+    first = load_tasks(str(source))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("source should not be parsed again")
+
+    monkeypatch.setattr(config.json, "loads", fail)
+    assert load_tasks(str(source)) == first
+
+    # A touch changes the mtime but not the hash: still no reparse
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_tasks(str(source)) == first
+
+
+def test_load_tasks_rebuilds_cache_on_source_change(tmp_path):
+    source = tmp_path / "tasks.json"
+    _write_catalog(source, ["a"])
+    assert [t.name for t in load_tasks(str(source))] == ["a"]
+
+    st = source.stat()
+    _write_catalog(source, ["b", "c"])
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert [t.name for t in load_tasks(str(source))] == ["b", "c"]
+    assert [t.name for t in load_tasks(str(source))] == ["b", "c"]
+
+
+def test_load_tasks_keeps_cache_out_of_config_dir(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    _write_catalog(config_dir / "tasks.json", ["a"])
+    cache_dir = tmp_path / "cache"
+
+    load_tasks(str(config_dir / "tasks.json"), cache_dir=str(cache_dir))
+    assert os.listdir(config_dir) == ["tasks.json"]
+    assert len(os.listdir(cache_dir)) == 1
@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+from server.health import HealthProber
+from server.task_manager import TaskManager
+
+
+async def _stub_server(status_line: bytes) -> asyncio.Server:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        writer.write(status_line + b"\r\nContent-Length: 2\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _manager(
+    tmp_path, links: list[tuple[str, str]], probes: dict[int, str] | None = None
+) -> TaskManager:
+    tasks = [
+        {
+            "name": f"Task {i}",
+            "category": "Test",
+            "link": link,
+            "type": task_type,
+            "secret": f"s{i}",
+        }
+        for i, (link, task_type) in enumerate(links)
+    ]
+    for i, probe in (probes or {}).items():
+        tasks[i]["probe"] = probe
+    config = tmp_path / "tasks.json"
+    config.write_text(json.dumps({"tasks": tasks}))
+    return TaskManager(str(config))
+
+
+def test_probe_all_excludes_down_tasks(tmp_path):
+    async def scenario():
+        up = await _stub_server(b"HTTP/1.1 200 OK")
+        down = await _stub_server(b"HTTP/1.1 503 Service Unavailable")
+        up_port = up.sockets[0].getsockname()[1]
+        down_port = down.sockets[0].getsockname()[1]
+        manager = _manager(
+            tmp_path,
+            [
+                (f"http://127.0.0.1:{up_port}/", "Dynamic"),
+                (f"http://127.0.0.1:{down_port}/", "Dynamic"),
+                ("notes.pdf", "Static"),
+            ],
+        )
+        prober = HealthProber(manager, timeout=2.0)
+        try:
+            health = await prober.probe_all()
+        finally:
+            await prober.aclose()
+            up.close()
+            down.close()
+        return manager, health
+
+    manager, health = asyncio.run(scenario())
+
+    assert set(health) == {0, 1}
+    assert health[0]["healthy"] and health[0]["status_code"] == 200
+    assert not health[1]["healthy"] and health[1]["status_code"] == 503
+    assert [t.id for t in manager.get_available_tasks()] == [0, 2]
+    assert manager.tasks_payload()[1]["health"]["healthy"] is False
+    assert manager.tasks_payload()[2]["health"] is None
+
+
+def test_probe_url_overrides_link(tmp_path):
+    async def scenario():
+        up = await _stub_server(b"HTTP/1.1 200 OK")
+        up_port = up.sockets[0].getsockname()[1]
+        # The player-facing link is unreachable from here; the probe URL is
+        manager = _manager(
+            tmp_path,
+            [("http://127.0.0.1:1/", "Dynamic")],
+            probes={0: f"http://127.0.0.1:{up_port}/"},
+        )
+        prober = HealthProber(manager, timeout=2.0)
+        try:
+            health = await prober.probe_all()
+        finally:
+            await prober.aclose()
+            up.close()
+        return manager, health
+
+    manager, health = asyncio.run(scenario())
+
+    assert health[0]["healthy"] and health[0]["status_code"] == 200
+    assert "probe" not in manager.tasks_payload()[0]
+
+
+def test_spin_keeps_progress_while_unused_tasks_are_down(tmp_path):
+    manager = _manager(
+        tmp_path, [("a.pdf", "Static")] * 2 + [("http://x", "Dynamic")] * 2
+    )
+    manager.used_tasks = {0, 1}
+    for task_id in (2, 3):
+        manager.task_health[task_id] = {
+            "healthy": False,
+            "status_code": None,
+            "latency_ms": None,
+            "error": "down",
+            "checked_at": 0.0,
+        }
+
+    assert manager.spin_wheel() == (None, None)
+    assert manager.used_tasks == {0, 1}
+
+    manager.used_tasks = {0, 1, 2, 3}
+    task, task_index = manager.spin_wheel()
+    assert manager.used_tasks == set()
+    assert task_index in (0, 1)
@@ -0,0 +1,244 @@
+"""
+Micro-benchmarks for the cookie service hot paths.
+
+Runs the FastAPI app in process through httpx's ASGI transport (no network)
+and reports ops/sec plus latency percentiles for the crypto helpers and the
+/register, /me and /admin routes.
+
+    cd task
+    python bench.py                          # print results
+    python bench.py --save main              # store bench_baselines/main.json
+    python bench.py --compare main           # diff against a saved baseline
+
+Endpoint responses with an unexpected status are counted as errors; any
+error makes --compare exit non-zero. Baselines are machine-specific and
+ignored by git.
+
+Needs the service requirements plus httpx.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from cookie.core.crypto import (
+    dec_session,
+    dec_session_fast,
+    enc_session,
+    parse_kv_fast,
+    parse_kv_semicolons,
+    pkcs7_pad,
+    pkcs7_unpad,
+)
+from cookie.core.session_cache import SessionCache
+from cookie.main import app
+
+BASELINE_DIR = Path("bench_baselines")
+NAME = "A" * 15
+
+
+def _summary(samples_ns: list[int], wall_s: float) -> dict[str, float]:
+    samples = sorted(samples_ns)
+    q = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "ops": len(samples),
+        "ops_per_sec": round(len(samples) / wall_s, 1),
+        "p50_us": round(q[49] / 1000, 2),
+        "p90_us": round(q[89] / 1000, 2),
+        "p99_us": round(q[98] / 1000, 2),
+        "max_us": round(samples[-1] / 1000, 2),
+    }
+
+
+def bench_func(fn: Callable[[], Any], iterations: int) -> dict[str, float]:
+    for _ in range(min(iterations, 1000)):
+        fn()
+    samples: list[int] = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for _ in range(iterations):
+        t0 = clock()
+        fn()
+        samples.append(clock() - t0)
+    return _summary(samples, (clock() - started) / 1e9)
+
+
+async def bench_endpoint(
+    request: Callable[[], Awaitable[httpx.Response]],
+    expected_status: int,
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    for _ in range(min(requests, 50)):
+        await request()
+
+    samples: list[int] = []
+    remaining = requests
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            t0 = time.perf_counter_ns()
+            resp = await request()
+            samples.append(time.perf_counter_ns() - t0)
+            if resp.status_code != expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result = _summary(samples, time.perf_counter() - started)
+    result["errors"] = errors
+    return result
+
+
+def run_functions(iterations: int) -> dict[str, dict[str, float]]:
+    token = enc_session(NAME)
+    pt = dec_session(token)
+    padded = pkcs7_pad(pt)
+    cache = SessionCache()
+    cache.get(token)
+
+    cases: dict[str, Callable[[], Any]] = {
+        "pkcs7_pad": lambda: pkcs7_pad(pt),
+        "pkcs7_unpad": lambda: pkcs7_unpad(padded),
+        "enc_session": lambda: enc_session(NAME),
+        "dec_session": lambda: dec_session(token),
+        "dec_session_fast": lambda: dec_session_fast(token),
+        "parse_kv_semicolons": lambda: parse_kv_semicolons(pt),
+        "parse_kv_fast": lambda: parse_kv_fast(pt),
+        "session_cache_hit": lambda: cache.get(token),
+    }
+    return {name: bench_func(fn, iterations) for name, fn in cases.items()}
+
+
+async def run_endpoints(requests: int, concurrency: int) -> dict[str, dict[str, float]]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        resp = await client.post("/register", data={"name": NAME})
+        token = resp.cookies["session"]
+        cookies = {"session": token}
+
+        # Cookies are passed per request so the client jar stays untouched
+        client.cookies.clear()
+        cases: dict[str, tuple[Callable[[], Awaitable[httpx.Response]], int]] = {
+            "POST /register": (
+                lambda: client.post("/register", data={"name": NAME}),
+                200,
+            ),
+            "GET /me": (lambda: client.get("/me", cookies=cookies), 200),
+            "GET /admin": (lambda: client.get("/admin", cookies=cookies), 403),
+        }
+        results: dict[str, dict[str, float]] = {}
+        for name, (request, status) in cases.items():
+            results[name] = await bench_endpoint(
+                request, status, requests, concurrency
+            )
+            client.cookies.clear()
+        return results
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Print ops/sec deltas; return the cases that slowed down past `threshold`
+    or answered with an unexpected status.
+    """
+    regressions: list[str] = []
+    for section in ("functions", "endpoints"):
+        for name, result in current[section].items():
+            errors = result.get("errors", 0)
+            if errors:
+                regressions.append(name)
+            base = baseline.get(section, {}).get(name)
+            if not base:
+                print(f"{name:<22} (no baseline){'  ERRORS' if errors else ''}")
+                continue
+            delta = result["ops_per_sec"] / base["ops_per_sec"] - 1
+            mark = f"  ERRORS ({errors})" if errors else ""
+            if delta < -threshold:
+                mark += "  REGRESSION"
+                if not errors:
+                    regressions.append(name)
+            print(
+                f"{name:<22} {base['ops_per_sec']:>12,.0f} -> "
+                f"{result['ops_per_sec']:>12,.0f} ops/s {delta:+7.1%}{mark}"
+            )
+    return regressions
+
+
+def print_results(results: dict[str, Any]) -> None:
+    header = (
+        f"{'case':<22} {'ops/s':>12} {'p50 us':>9} {'p90 us':>9} {'p99 us':>9} "
+        f"{'errors':>7}"
+    )
+    for section in ("functions", "endpoints"):
+        print(f"\n[{section}]")
+        print(header)
+        for name, r in results[section].items():
+            print(
+                f"{name:<22} {r['ops_per_sec']:>12,.0f} {r['p50_us']:>9} "
+                f"{r['p90_us']:>9} {r['p99_us']:>9} {r.get('errors', '-'):>7}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cookie service micro-benchmarks")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--save", metavar="NAME", help="store results as a baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare to a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="ops/sec drop that counts as a regression (default 0.10)",
+    )
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": int(time.time()),
+            "concurrency": args.concurrency,
+        },
+        "functions": run_functions(args.iterations),
+        "endpoints": asyncio.run(run_endpoints(args.requests, args.concurrency)),
+    }
+    print_results(results)
+
+    status = 0
+    if args.compare:
+        baseline = json.loads((BASELINE_DIR / f"{args.compare}.json").read_text())
+        print(f"\n[compare vs {args.compare}]")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nregressions: {', '.join(regressions)}", file=sys.stderr)
+            status = 1
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        path = BASELINE_DIR / f"{args.save}.json"
+        path.write_text(json.dumps(results, indent=2))
+        print(f"\nbaseline saved to {path}")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
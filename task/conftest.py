@@ -0,0 +1,10 @@
+# Makes the `cookie` package importable when pytest runs from the repo root.
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _run_from_task_dir(monkeypatch):
+    # templates and sources are resolved relative to the working directory
+    monkeypatch.chdir(os.path.dirname(os.path.abspath(__file__)))
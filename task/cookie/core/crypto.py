@@ -1,10 +1,13 @@
 import base64
+import binascii
 import os
 
-from Crypto.Cipher import AES
+from cookie.core.keyring import SessionKey, load_keyring
 
 BLOCK = 16
-KEY = os.urandom(16)
+KEYRING = load_keyring()
+
+_PADDING = [bytes([n]) * n for n in range(BLOCK + 1)]
 
 
 def pkcs7_pad(data: bytes, block: int = BLOCK) -> bytes:
@@ -24,15 +27,34 @@ def pkcs7_unpad(data: bytes, block: int = BLOCK) -> bytes:
 def enc_session(name: str) -> str:
     kv = {"user": name, "admin": "false", "expires": "2099-12-31"}
     pt = build_kv_semicolons(kv)
+    key = KEYRING.primary
     iv = os.urandom(BLOCK)
-    ct = AES.new(KEY, AES.MODE_CBC, iv).encrypt(pkcs7_pad(pt))
-    return base64.b64encode(iv + ct).decode()
+    ct = key.cbc_encrypt(iv, pkcs7_pad(pt))
+    return key.kid + "." + base64.b64encode(iv + ct).decode()
+
+
+def split_token(token_b64: str) -> tuple[SessionKey, bytes]:
+    """
+    Resolve a ``kid.base64(iv+ct)`` token to its key and raw iv+ct bytes.
+
+    Base64 is decoded strictly so every session has exactly one accepted
+    spelling; see `session_id`.
+    """
+    kid, sep, body = token_b64.partition(".")
+    if not sep:
+        raise ValueError("missing key id")
+    return KEYRING.get(kid), binascii.a2b_base64(body, strict_mode=True)
+
+
+def session_id(key: SessionKey, raw: bytes) -> bytes:
+    """Canonical identity of a session: key id plus the raw iv+ct bytes."""
+    return key.kid.encode() + b"." + raw
 
 
 def dec_session(token_b64: str) -> bytes:
-    raw = base64.b64decode(token_b64)
+    key, raw = split_token(token_b64)
     iv, ct = raw[:BLOCK], raw[BLOCK:]
-    pt = pkcs7_unpad(AES.new(KEY, AES.MODE_CBC, iv).decrypt(ct))
+    pt = pkcs7_unpad(key.cbc_decrypt(iv, ct))
     return pt
 
 
@@ -64,3 +86,48 @@ def build_kv_semicolons(kv: dict[str, str]) -> bytes:
         else:
             parts.append(key_b + b"=" + str(value).encode())
     return b";".join(parts)
+
+
+# Fast decode path. The functions above are the reference implementation; the
+# ones below must produce identical results and are what the routes use.
+# Encryption has no fast variant: its cost is the sequential CBC chain, which
+# a shortcut around the kv dict does not measurably change.
+
+
+def dec_session_fast(token_b64: str) -> memoryview:
+    """dec_session returning a zero-copy view of the unpadded plaintext."""
+    key, raw = split_token(token_b64)
+    return decrypt_session_fast(key, raw)
+
+
+def decrypt_session_fast(key: SessionKey, raw: bytes) -> memoryview:
+    # pycryptodome is much slower on memoryview input, so the cipher gets bytes
+    pt = memoryview(key.cbc_decrypt(raw[:BLOCK], raw[BLOCK:]))
+    n = pt[-1]
+    if n == 0 or n > BLOCK or pt[-n:] != _PADDING[n]:
+        raise ValueError("bad padding")
+    return pt[:-n]
+
+
+def parse_kv_fast(pt: bytes | memoryview) -> dict[str, str]:
+    """
+    parse_kv_semicolons with one decode for the whole buffer.
+
+    Pure-ASCII input (every token enc_session issues) is decoded once and
+    split as str; anything else goes through the reference parser so
+    errors="ignore" handling stays byte-for-byte identical.
+    """
+    try:
+        text = str(pt, "ascii")
+    except UnicodeDecodeError:
+        return parse_kv_semicolons(bytes(pt))
+    out: dict[str, str] = {}
+    for chunk in text.split(";"):
+        if chunk:
+            k, _, v = chunk.partition("=")
+            out[k] = v
+    return out
+
+
+def load_session_fast(token_b64: str) -> dict[str, str]:
+    return parse_kv_fast(dec_session_fast(token_b64))
@@ -0,0 +1,125 @@
+"""
+Session keys shared by every worker/replica of the cookie service.
+
+Keys come from ``COOKIE_KEYRING_FILE`` (path) or ``COOKIE_KEYS`` (inline),
+both in the same format: ``kid:hexkey`` entries separated by commas or
+whitespace. The first entry is the primary key used for new sessions; the
+rest stay valid for decryption so keys can be rotated without logging
+everyone out. Tokens carry the id of the key that issued them
+(``kid.base64(iv+ct)``); tokens without one are rejected. Without either
+variable a random per-process key is used, which only works with a single
+worker; startup fails if WEB_CONCURRENCY asks for more.
+
+Example: COOKIE_KEYS="k2:00112233445566778899aabbccddeeff,k1:..."
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import warnings
+from collections.abc import Mapping
+from pathlib import Path
+
+from Crypto.Cipher import AES
+
+BLOCK = AES.block_size
+KID_RE = re.compile(r"^[A-Za-z0-9_-]{1,16}$")
+
+
+class SessionKey:
+    """
+    One AES key with a cipher object built once and reused for every request.
+
+    ECB is only the block primitive here: CBC chaining is done by hand so a
+    single stateless cipher serves all IVs, and decryption runs every block
+    through AES in one call before XOR-ing with the previous ciphertext.
+    """
+
+    __slots__ = ("kid", "_ecb")
+
+    def __init__(self, kid: str, key: bytes) -> None:
+        if not KID_RE.match(kid):
+            raise ValueError(f"invalid key id: {kid!r}")
+        if len(key) not in (16, 24, 32):
+            raise ValueError(f"key {kid!r} must be 16, 24 or 32 bytes")
+        self.kid = kid
+        self._ecb = AES.new(key, AES.MODE_ECB)
+
+    def cbc_encrypt(self, iv: bytes, data: bytes) -> bytes:
+        if len(iv) != BLOCK or len(data) % BLOCK != 0:
+            raise ValueError("bad block alignment")
+        out = bytearray()
+        prev = int.from_bytes(iv, "big")
+        for i in range(0, len(data), BLOCK):
+            block = (int.from_bytes(data[i : i + BLOCK], "big") ^ prev).to_bytes(
+                BLOCK, "big"
+            )
+            ct = self._ecb.encrypt(block)
+            out += ct
+            prev = int.from_bytes(ct, "big")
+        return bytes(out)
+
+    def cbc_decrypt(self, iv: bytes | memoryview, data: bytes | memoryview) -> bytes:
+        if len(iv) != BLOCK or not data or len(data) % BLOCK != 0:
+            raise ValueError("bad block alignment")
+        plain = int.from_bytes(self._ecb.decrypt(data), "big")
+        chain = (int.from_bytes(iv, "big") << (8 * (len(data) - BLOCK))) | (
+            int.from_bytes(data[:-BLOCK], "big")
+        )
+        return (plain ^ chain).to_bytes(len(data), "big")
+
+
+class Keyring:
+    def __init__(self, keys: list[SessionKey]) -> None:
+        if not keys:
+            raise ValueError("keyring is empty")
+        self.primary = keys[0]
+        self._by_id: dict[str, SessionKey] = {}
+        for key in keys:
+            if key.kid in self._by_id:
+                raise ValueError(f"duplicate key id: {key.kid!r}")
+            self._by_id[key.kid] = key
+
+    def get(self, kid: str) -> SessionKey:
+        try:
+            return self._by_id[kid]
+        except KeyError:
+            raise ValueError(f"unknown key id: {kid!r}") from None
+
+    @property
+    def kids(self) -> list[str]:
+        return list(self._by_id)
+
+
+def parse_keyring(spec: str) -> Keyring:
+    keys: list[SessionKey] = []
+    for entry in re.split(r"[,\s]+", spec.strip()):
+        if not entry:
+            continue
+        kid, sep, hexkey = entry.partition(":")
+        if not sep:
+            raise ValueError(f"keyring entry must be kid:hexkey, got {entry!r}")
+        keys.append(SessionKey(kid, bytes.fromhex(hexkey)))
+    return Keyring(keys)
+
+
+def load_keyring(env: Mapping[str, str] = os.environ) -> Keyring:
+    path = env.get("COOKIE_KEYRING_FILE")
+    if path:
+        return parse_keyring(Path(path).read_text())
+    spec = env.get("COOKIE_KEYS")
+    if spec:
+        return parse_keyring(spec)
+    if int(env.get("WEB_CONCURRENCY") or "1") > 1:
+        raise RuntimeError(
+            "WEB_CONCURRENCY > 1 needs COOKIE_KEYS or COOKIE_KEYRING_FILE so every "
+            "worker can read sessions issued by the others"
+        )
+    warnings.warn(
+        "COOKIE_KEYS/COOKIE_KEYRING_FILE not set; using a random per-process "
+        "session key, run a single worker only",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+    return Keyring([SessionKey("dev", os.urandom(16))])
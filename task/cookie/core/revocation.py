@@ -0,0 +1,241 @@
+"""
+Revocation list for stateless sessions.
+
+Sessions are identified by `crypto.session_id` (key id plus raw iv+ct), so
+re-encoding a cookie does not dodge a logout. /me and /admin ask
+`is_revoked` for every request. The Bloom filter answers "definitely not
+revoked" for almost all sessions after one blake2b digest and a few bit
+lookups; only filter hits consult the exact store. Entries are dropped once
+the session's own `expires` date has passed, and the filter is rebuilt from
+the remaining entries.
+
+Issued sessions expire in 2099, so expiry alone never bounds the list: a
+/register + /logout loop would grow it forever. At most `max_entries`
+revocations are kept. Past that the oldest tenth is forgotten, which makes
+those sessions valid again, and the shared file is compacted whenever it
+holds twice that many records. Memory and disk therefore stay bounded. The
+cost is that a flood of logouts can push out older ones.
+
+With ``COOKIE_REVOCATION_FILE`` set, revocations are appended to that file
+as fixed-size records and every worker tails it, so a logout handled by one
+worker is seen by all of them (and by replicas sharing the file). Without
+it the list is kept in process memory, which is refused when uvicorn runs
+more than one worker (``WEB_CONCURRENCY``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import itertools
+import math
+import os
+import struct
+import time
+from collections.abc import Iterator, Mapping
+
+DIGEST_SIZE = 16
+# digest, wall-clock expiry of the session (inf = never)
+RECORD = struct.Struct("<16sd")
+
+
+def token_digest(sid: bytes) -> bytes:
+    return hashlib.blake2b(sid, digest_size=DIGEST_SIZE).digest()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 16-byte digests (double hashing)."""
+
+    __slots__ = ("capacity", "size", "hashes", "_bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(capacity, 1)
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.capacity = capacity
+        self.size = max(size, 8)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest: bytes) -> list[int]:
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, digest: bytes) -> None:
+        for pos in self._positions(digest):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
+
+class RevocationList:
+    def __init__(
+        self,
+        path: str | None = None,
+        capacity: int = 10_000,
+        error_rate: float = 0.001,
+        prune_interval: float = 60.0,
+        max_entries: int = 100_000,
+    ) -> None:
+        self.path = path
+        self.error_rate = error_rate
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval
+        # digest -> wall-clock expiry of the revoked session (None = never)
+        self._entries: dict[bytes, float | None] = {}
+        self._filter = BloomFilter(capacity, error_rate)
+        self._next_prune = time.monotonic() + prune_interval
+        # position in the shared file up to which records have been read
+        self._inode: int | None = None
+        self._offset = 0
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._sync()
+
+    def __len__(self) -> int:
+        self._sync()
+        return len(self._entries)
+
+    def revoke(self, sid: bytes, expires_at: float | None = None) -> None:
+        if expires_at is not None and expires_at <= time.time():
+            return
+        digest = token_digest(sid)
+        if self.path is None:
+            self._add(digest, expires_at)
+            return
+        record = RECORD.pack(digest, math.inf if expires_at is None else expires_at)
+        with self._locked():
+            with open(self.path, "ab") as f:
+                f.write(record)
+                size = f.tell()
+            if size >= 2 * self.max_entries * RECORD.size:
+                self._sync()
+                self._rewrite()
+        self._sync()
+
+    def is_revoked(self, sid: bytes) -> bool:
+        self._maybe_prune()
+        self._sync()
+        digest = token_digest(sid)
+        if digest not in self._filter:
+            return False
+        expires_at = self._entries.get(digest, 0.0)
+        if expires_at is None:
+            return True
+        return expires_at > time.time()
+
+    def prune(self) -> int:
+        """Drop revocations whose session has expired; returns how many."""
+        if self.path is None:
+            return self._drop_expired()
+        with self._locked():
+            self._sync()
+            dropped = self._drop_expired()
+            if dropped:
+                self._rewrite()
+        return dropped
+
+    def _rewrite(self) -> None:
+        """Replace the shared file with the current entries; needs the lock."""
+        assert self.path is not None
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            for digest, expires_at in self._entries.items():
+                f.write(
+                    RECORD.pack(digest, math.inf if expires_at is None else expires_at)
+                )
+        os.replace(tmp, self.path)
+        self._sync()
+
+    def _drop_expired(self) -> int:
+        now = time.time()
+        expired = [
+            digest
+            for digest, expires_at in self._entries.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for digest in expired:
+            del self._entries[digest]
+        if expired:
+            self._rebuild(self._filter.capacity)
+        return len(expired)
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._next_prune = now + self.prune_interval
+            self.prune()
+
+    def _add(self, digest: bytes, expires_at: float | None) -> None:
+        self._entries[digest] = expires_at
+        if len(self._entries) > self.max_entries:
+            # dicts keep insertion order, so the oldest revocations go first;
+            # every worker reads the same records and evicts the same ones
+            evict = self.max_entries // 10 or 1
+            for old in list(itertools.islice(self._entries, evict)):
+                del self._entries[old]
+            self._rebuild(self._filter.capacity)
+        elif len(self._entries) > self._filter.capacity:
+            self._rebuild(self._filter.capacity * 2)
+        else:
+            self._filter.add(digest)
+
+    def _rebuild(self, capacity: int) -> None:
+        bloom = BloomFilter(max(capacity, len(self._entries)), self.error_rate)
+        for digest in self._entries:
+            bloom.add(digest)
+        self._filter = bloom
+
+    def _sync(self) -> None:
+        """Read records other workers appended since the last call."""
+        if self.path is None:
+            return
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if st.st_ino == self._inode and st.st_size - self._offset < RECORD.size:
+            return
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != self._inode or st.st_size < self._offset:
+                # compacted by prune(): start over from the new file
+                self._inode = st.st_ino
+                self._offset = 0
+                self._entries.clear()
+                self._rebuild(self._filter.capacity)
+            f.seek(self._offset)
+            whole = (st.st_size - self._offset) // RECORD.size * RECORD.size
+            data = f.read(whole)
+        data = data[: len(data) // RECORD.size * RECORD.size]
+        for digest, expires_at in RECORD.iter_unpack(data):
+            self._add(digest, None if math.isinf(expires_at) else expires_at)
+        self._offset += len(data)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        assert self.path is not None
+        with open(self.path + ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_revocations(env: Mapping[str, str] = os.environ) -> RevocationList:
+    path = env.get("COOKIE_REVOCATION_FILE")
+    if path:
+        return RevocationList(path)
+    if int(env.get("WEB_CONCURRENCY") or "1") > 1:
+        raise RuntimeError(
+            "WEB_CONCURRENCY > 1 needs COOKIE_REVOCATION_FILE so every worker "
+            "sees logouts"
+        )
+    return RevocationList()
+
+
+revocations = load_revocations()
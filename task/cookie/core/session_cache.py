@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Callable
+
+from cookie.core.crypto import (
+    decrypt_session_fast,
+    parse_kv_fast,
+    session_id,
+    split_token,
+)
+from cookie.core.keyring import SessionKey
+
+SESSION_MAX_AGE = 3600
+
+
+def session_expires_at(kv: dict[str, str]) -> float | None:
+    """Wall-clock timestamp of the end of the session's `expires` day."""
+    raw = kv.get("expires")
+    if not raw:
+        return None
+    try:
+        day = date.fromisoformat(raw)
+    except ValueError:
+        return None
+    end = datetime(day.year, day.month, day.day, 23, 59, 59, tzinfo=timezone.utc)
+    return end.timestamp()
+
+
+class SessionRevoked(ValueError):
+    """The token is well-formed but its session has been logged out."""
+
+
+def _decode(key: SessionKey, raw: bytes) -> dict[str, str]:
+    return parse_kv_fast(decrypt_session_fast(key, raw))
+
+
+class SessionCache:
+    """
+    Bounded LRU of decoded sessions keyed by their canonical `session_id`.
+
+    Positive entries live for at most `max_age` seconds and never past the
+    session's own `expires` date. Tokens that fail to decode are remembered
+    by their raw cookie value in a separate, smaller-TTL negative cache so a
+    flood of bad cookies cannot evict good sessions and costs one dict
+    lookup per request. Returned dicts are shared between hits and must not
+    be mutated.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        max_age: float = SESSION_MAX_AGE,
+        negative_maxsize: int = 4096,
+        negative_ttl: float = 60.0,
+        max_token_len: int = 4096,
+        decode: Callable[[SessionKey, bytes], dict[str, str]] = _decode,
+    ) -> None:
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.negative_maxsize = negative_maxsize
+        self.negative_ttl = negative_ttl
+        self.max_token_len = max_token_len
+        self.decode = decode
+        self._hits: OrderedDict[bytes, tuple[float, dict[str, str]]] = OrderedDict()
+        self._misses: OrderedDict[str, float] = OrderedDict()
+
+    def lookup(
+        self, token: str, is_revoked: Callable[[bytes], bool] | None = None
+    ) -> tuple[bytes, dict[str, str]]:
+        """
+        Return ``(session_id, parsed session)`` for `token`.
+
+        Raises ValueError if the token is malformed or does not decrypt.
+        `is_revoked` is asked before any cache hit or decryption, since the
+        session id only needs the base64 decode; a revoked session raises
+        SessionRevoked.
+        """
+        now = time.monotonic()
+
+        bad_until = self._misses.get(token)
+        if bad_until is not None:
+            if bad_until > now:
+                raise ValueError("invalid session")
+            del self._misses[token]
+
+        try:
+            key, raw = split_token(token)
+            sid = session_id(key, raw)
+            if is_revoked is not None and is_revoked(sid):
+                self._hits.pop(sid, None)
+                raise SessionRevoked("session revoked")
+            entry = self._hits.get(sid)
+            if entry is not None:
+                deadline, kv = entry
+                if deadline > now:
+                    self._hits.move_to_end(sid)
+                    return sid, kv
+                del self._hits[sid]
+            kv = self.decode(key, raw)
+        except SessionRevoked:
+            raise
+        except Exception as e:
+            if len(token) <= self.max_token_len:
+                self._remember_bad(token, now + self.negative_ttl)
+            raise ValueError("invalid session") from e
+
+        ttl = self.max_age
+        expires_at = session_expires_at(kv)
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0 and len(token) <= self.max_token_len:
+            self._hits[sid] = (now + ttl, kv)
+            if len(self._hits) > self.maxsize:
+                self._hits.popitem(last=False)
+        return sid, kv
+
+    def get(self, token: str) -> dict[str, str]:
+        """Return the parsed session for `token`, raising ValueError if invalid."""
+        return self.lookup(token)[1]
+
+    def _remember_bad(self, token: str, until: float) -> None:
+        self._misses[token] = until
+        self._misses.move_to_end(token)
+        if len(self._misses) > self.negative_maxsize:
+            self._misses.popitem(last=False)
+
+    def discard(self, sid: bytes) -> None:
+        self._hits.pop(sid, None)
+
+    def clear(self) -> None:
+        self._hits.clear()
+        self._misses.clear()
+
+
+session_cache = SessionCache()
@@ -8,6 +8,14 @@ app.include_router(session_router)
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn  # type: ignore
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers share sessions only when COOKIE_KEYS/COOKIE_KEYRING_FILE is set
+    uvicorn.run(
+        "cookie.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 import os
 
-from cookie.core.crypto import dec_session, enc_session, parse_kv_semicolons
+from cookie.core.crypto import enc_session
+from cookie.core.revocation import revocations
+from cookie.core.session_cache import (
+    SESSION_MAX_AGE,
+    SessionRevoked,
+    session_cache,
+    session_expires_at,
+)
 from cookie.schemas.session import RegisterRequest
 from fastapi import APIRouter, Cookie, Form, Request
 from fastapi.responses import (
@@ -30,14 +37,18 @@ async def me(request: Request, session: str | None = Cookie(default=None)):
             {"request": request, "error": "You are not logged in."},
         )
     try:
-        pt = dec_session(session)
-        kv = parse_kv_semicolons(pt)
-        return JSONResponse(kv)
+        _, kv = session_cache.lookup(session, revocations.is_revoked)
+    except SessionRevoked:
+        return templates.TemplateResponse(
+            "index.html",
+            {"request": request, "error": "Your session has been revoked."},
+        )
     except Exception:
         return templates.TemplateResponse(
             "index.html",
             {"request": request, "error": "Your session is invalid."},
         )
+    return JSONResponse(kv)
 
 
 @router.post("/register", response_class=HTMLResponse)
@@ -62,11 +73,29 @@ async def register(request: Request, name: str = Form(...)):
         httponly=True,
         samesite="lax",
         secure=False,
-        max_age=3600,
+        max_age=SESSION_MAX_AGE,
     )
     return resp
 
 
+@router.post("/logout", response_class=HTMLResponse)
+async def logout(request: Request, session: str | None = Cookie(default=None)):
+    if session:
+        try:
+            # already revoked sessions are not appended again
+            sid, kv = session_cache.lookup(session, revocations.is_revoked)
+        except Exception:
+            pass
+        else:
+            revocations.revoke(sid, session_expires_at(kv))
+            session_cache.discard(sid)
+    resp = templates.TemplateResponse(
+        "index.html", {"request": request, "message": "Logged out."}
+    )
+    resp.delete_cookie(key="session", httponly=True, samesite="lax")
+    return resp
+
+
 @router.get("/admin")
 async def admin(request: Request, session: str | None = Cookie(default=None)):
     if not session:
@@ -74,18 +103,20 @@ async def admin(request: Request, session: str | None = Cookie(default=None)):
             "forbidden.html", {"request": request}, status_code=401
         )
     try:
-        pt = dec_session(session)
-        kv = parse_kv_semicolons(pt)
-        if kv.get("admin") == "true":
-            return PlainTextResponse(os.environ.get("FLAG") or "test_flag")
-        else:
-            return templates.TemplateResponse(
-                "forbidden.html", {"request": request}, status_code=403
-            )
+        _, kv = session_cache.lookup(session, revocations.is_revoked)
+    except SessionRevoked:
+        return templates.TemplateResponse(
+            "forbidden.html", {"request": request}, status_code=401
+        )
     except Exception:
         return templates.TemplateResponse(
             "forbidden.html", {"request": request}, status_code=400
         )
+    if kv.get("admin") == "true":
+        return PlainTextResponse(os.environ.get("FLAG") or "test_flag")
+    return templates.TemplateResponse(
+        "forbidden.html", {"request": request}, status_code=403
+    )
 
 
 @router.get("/sources")
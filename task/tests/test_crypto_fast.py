@@ -0,0 +1,73 @@
+import base64
+import os
+import random
+import string
+
+from cookie.core import crypto
+
+CASES = 2000
+NAME_CHARS = string.ascii_letters + string.digits + ";=é"
+
+
+def _outcome(fn, *args):
+    try:
+        return fn(*args)
+    except ValueError:
+        return ValueError
+
+
+def _ref_load(token: str):
+    return crypto.parse_kv_semicolons(crypto.dec_session(token))
+
+
+def _token(raw: bytes) -> str:
+    return crypto.KEYRING.primary.kid + "." + base64.b64encode(raw).decode()
+
+
+def test_fast_decode_matches_reference_on_issued_tokens():
+    rng = random.Random(1)
+    for i in range(CASES):
+        name = "" if i == 0 else "".join(
+            rng.choice(NAME_CHARS) for _ in range(rng.randint(1, 60))
+        )
+        token = crypto.enc_session(name)
+        expected = crypto.dec_session(token)
+        assert bytes(crypto.dec_session_fast(token)) == expected
+        assert crypto.load_session_fast(token) == _ref_load(token)
+
+
+def test_parse_kv_fast_matches_reference_on_random_bytes():
+    rng = random.Random(2)
+    for _ in range(CASES):
+        buf = bytes(
+            rng.choice(b";=ab\x80\xff") if rng.random() < 0.5 else rng.randrange(256)
+            for _ in range(rng.randint(0, 48))
+        )
+        expected = crypto.parse_kv_semicolons(buf)
+        assert crypto.parse_kv_fast(buf) == expected
+        assert crypto.parse_kv_fast(memoryview(buf)) == expected
+
+
+def test_fast_decode_matches_reference_on_tampered_tokens():
+    rng = random.Random(3)
+    key = crypto.KEYRING.primary
+    for _ in range(CASES):
+        token = crypto.enc_session("A" * rng.randint(3, 50))
+        raw = bytearray(base64.b64decode(token.partition(".")[2]))
+        if rng.random() < 0.5:
+            # bit flips anywhere in iv+ct
+            for _ in range(rng.randint(1, 3)):
+                raw[rng.randrange(len(raw))] ^= 1 << rng.randrange(8)
+        else:
+            # valid CBC, arbitrary (mostly bad) padding
+            iv = os.urandom(crypto.BLOCK)
+            pt = os.urandom(crypto.BLOCK * rng.randint(0, 3))
+            pt += bytes([rng.randint(0, 17)]) * crypto.BLOCK
+            raw = bytearray(iv + key.cbc_encrypt(iv, pt))
+        tampered = _token(bytes(raw))
+        assert _outcome(crypto.dec_session, tampered) == _outcome(
+            lambda t: bytes(crypto.dec_session_fast(t)), tampered
+        )
+        assert _outcome(_ref_load, tampered) == _outcome(
+            crypto.load_session_fast, tampered
+        )
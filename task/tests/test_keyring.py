@@ -0,0 +1,119 @@
+import random
+
+import pytest
+from Crypto.Cipher import AES
+
+from cookie.core import crypto
+from cookie.core.keyring import (
+    BLOCK,
+    Keyring,
+    SessionKey,
+    load_keyring,
+    parse_keyring,
+)
+
+K1 = "k1:" + "11" * 16
+K2 = "k2:" + "22" * 32
+
+
+def test_cbc_matches_pycryptodome():
+    rng = random.Random(1)
+    for _ in range(200):
+        key = rng.randbytes(rng.choice((16, 24, 32)))
+        iv = rng.randbytes(BLOCK)
+        data = rng.randbytes(BLOCK * rng.randint(1, 8))
+        ct = AES.new(key, AES.MODE_CBC, iv).encrypt(data)
+
+        session_key = SessionKey("t", key)
+        assert session_key.cbc_encrypt(iv, data) == ct
+        assert session_key.cbc_decrypt(iv, ct) == data
+        assert session_key.cbc_decrypt(memoryview(iv), memoryview(ct)) == data
+
+
+@pytest.mark.parametrize("data", [b"", b"x" * 15, b"x" * 17])
+def test_cbc_rejects_misaligned_input(data):
+    key = SessionKey("t", bytes(16))
+    with pytest.raises(ValueError):
+        key.cbc_decrypt(bytes(BLOCK), data)
+    if data:
+        with pytest.raises(ValueError):
+            key.cbc_encrypt(bytes(BLOCK), data)
+
+
+def test_parse_keyring_orders_primary_first():
+    keyring = parse_keyring(f" {K2},\n{K1} ")
+    assert keyring.primary.kid == "k2"
+    assert keyring.kids == ["k2", "k1"]
+    assert keyring.get("k1").kid == "k1"
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "",
+        "k1",  # no separator
+        "k1:zz" + "11" * 15,  # not hex
+        "k1:" + "11" * 15,  # wrong key length
+        "bad.kid:" + "11" * 16,  # '.' separates the kid from the token body
+        "k" * 17 + ":" + "11" * 16,
+        f"{K1},{K1}",
+    ],
+)
+def test_parse_keyring_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        parse_keyring(spec)
+
+
+def test_keyring_rejects_unknown_kid():
+    with pytest.raises(ValueError):
+        parse_keyring(K1).get("k2")
+    with pytest.raises(ValueError):
+        Keyring([])
+
+
+def test_load_keyring_sources(tmp_path):
+    path = tmp_path / "keys"
+    path.write_text(K2 + "\n")
+    assert load_keyring({"COOKIE_KEYRING_FILE": str(path), "COOKIE_KEYS": K1}).kids == [
+        "k2"
+    ]
+    assert load_keyring({"COOKIE_KEYS": K1}).kids == ["k1"]
+    with pytest.warns(RuntimeWarning):
+        assert load_keyring({}).kids == ["dev"]
+
+
+def test_load_keyring_refuses_random_key_with_several_workers():
+    with pytest.raises(RuntimeError):
+        load_keyring({"WEB_CONCURRENCY": "4"})
+    assert load_keyring({"WEB_CONCURRENCY": "4", "COOKIE_KEYS": K1}).kids == ["k1"]
+
+
+def test_tokens_need_a_known_key_id(monkeypatch):
+    monkeypatch.setattr(crypto, "KEYRING", parse_keyring(K1))
+    token = crypto.enc_session("alice")
+    kid, _, body = token.partition(".")
+    assert kid == "k1"
+
+    with pytest.raises(ValueError):
+        crypto.dec_session(body)  # missing prefix
+    with pytest.raises(ValueError):
+        crypto.dec_session("k9." + body)  # unknown kid
+
+
+def test_rotation_keeps_old_sessions_valid(monkeypatch):
+    monkeypatch.setattr(crypto, "KEYRING", parse_keyring(K1))
+    old = crypto.enc_session("alice")
+    old_bob = crypto.enc_session("bob")
+
+    # k2 becomes primary; k1 is kept for decryption only
+    monkeypatch.setattr(crypto, "KEYRING", parse_keyring(f"{K2},{K1}"))
+    new = crypto.enc_session("carol")
+    assert new.startswith("k2.")
+    assert crypto.parse_kv_semicolons(crypto.dec_session(old))["user"] == "alice"
+    assert crypto.load_session_fast(old_bob)["user"] == "bob"
+    assert crypto.load_session_fast(new)["user"] == "carol"
+
+    # once k1 is dropped its sessions stop working
+    monkeypatch.setattr(crypto, "KEYRING", parse_keyring(K2))
+    with pytest.raises(ValueError):
+        crypto.load_session_fast(old)
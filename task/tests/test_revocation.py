@@ -0,0 +1,127 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cookie.core.crypto import enc_session
+from cookie.core.revocation import RECORD, RevocationList, load_revocations
+from cookie.core.session_cache import SessionCache, SessionRevoked
+from cookie.main import app
+from cookie.routers import session as session_router
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(session_router, "revocations", RevocationList())
+    monkeypatch.setattr(session_router, "session_cache", SessionCache())
+    return TestClient(app)
+
+
+def _register(client: TestClient, name: str = "alice") -> str:
+    resp = client.post("/register", data={"name": name})
+    client.cookies.clear()
+    return resp.cookies["session"].strip('"')
+
+
+def _get(client: TestClient, path: str, token: str):
+    return client.get(path, headers={"Cookie": f'session="{token}"'})
+
+
+def test_logout_revokes_every_spelling_of_the_session(client):
+    token = _register(client)
+    assert _get(client, "/me", token).json()["user"] == "alice"
+
+    client.post("/logout", headers={"Cookie": f'session="{token}"'})
+
+    kid, _, body = token.partition(".")
+    replays = [
+        token,
+        body,  # key id stripped
+        f"{kid}.{body[:4]}!{body[4:]}",  # junk the lenient decoder would skip
+        f"{kid}.{body[:8]} {body[8:]}",
+    ]
+    for replay in replays:
+        me = _get(client, "/me", replay)
+        assert me.headers["content-type"].startswith("text/html"), replay
+        assert "Your session" in me.text
+        assert _get(client, "/admin", replay).status_code in (400, 401)
+
+
+def test_other_sessions_survive_logout(client):
+    alice = _register(client, "alice")
+    bob = _register(client, "bob")
+    client.post("/logout", headers={"Cookie": f'session="{alice}"'})
+    assert _get(client, "/me", bob).json()["user"] == "bob"
+    assert _get(client, "/admin", bob).status_code == 403
+
+
+def test_shared_file_is_seen_by_every_worker(tmp_path):
+    path = str(tmp_path / "revoked.bin")
+    worker_a = RevocationList(path, prune_interval=0)
+    worker_b = RevocationList(path, prune_interval=0)
+
+    worker_a.revoke(b"k1.session-1")
+    worker_a.revoke(b"k1.session-2", time.time() + 0.05)
+    assert worker_b.is_revoked(b"k1.session-1")
+    assert worker_b.is_revoked(b"k1.session-2")
+    assert not worker_b.is_revoked(b"k1.session-3")
+
+    time.sleep(0.1)
+    assert worker_b.prune() == 1
+    assert worker_a.is_revoked(b"k1.session-1")
+    assert not worker_a.is_revoked(b"k1.session-2")
+    assert len(worker_a) == len(worker_b) == 1
+
+
+def test_in_memory_list_refused_for_multiple_workers(tmp_path):
+    with pytest.raises(RuntimeError):
+        load_revocations({"WEB_CONCURRENCY": "4"})
+    shared = load_revocations(
+        {"WEB_CONCURRENCY": "4", "COOKIE_REVOCATION_FILE": str(tmp_path / "r.bin")}
+    )
+    assert shared.path is not None
+
+
+def test_revoked_session_is_rejected_before_decrypting():
+    decoded: list[bytes] = []
+
+    def decode(key, raw):
+        decoded.append(raw)
+        return {"user": "alice", "admin": "false", "expires": "2099-12-31"}
+
+    cache = SessionCache(decode=decode)
+    revoked = RevocationList()
+    token = enc_session("alice")
+    sid, _ = cache.lookup(token, revoked.is_revoked)
+
+    revoked.revoke(sid)
+    with pytest.raises(SessionRevoked):
+        cache.lookup(token, revoked.is_revoked)
+    fresh = SessionCache(decode=decode)
+    with pytest.raises(SessionRevoked):
+        fresh.lookup(token, revoked.is_revoked)
+    assert len(decoded) == 1
+
+
+def test_entries_are_capped_oldest_first():
+    revoked = RevocationList(max_entries=10)
+    for i in range(25):
+        revoked.revoke(f"k1.session-{i}".encode())
+    assert len(revoked) <= 10
+    assert revoked.is_revoked(b"k1.session-24")
+    assert not revoked.is_revoked(b"k1.session-0")
+
+
+def test_shared_file_is_compacted_at_the_cap(tmp_path):
+    path = tmp_path / "revoked.bin"
+    worker_a = RevocationList(str(path), max_entries=10)
+    worker_b = RevocationList(str(path), max_entries=10)
+    for i in range(100):
+        worker = worker_a if i % 2 else worker_b
+        worker.revoke(f"k1.session-{i}".encode())
+
+    assert path.stat().st_size < 2 * 10 * RECORD.size
+    assert len(worker_a) == len(worker_b) <= 10
+    assert worker_a._entries == worker_b._entries
+    assert worker_b.is_revoked(b"k1.session-99")
+    assert not worker_b.is_revoked(b"k1.session-50")
@@ -0,0 +1,168 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from cookie.core import session_cache as sc
+from cookie.core.crypto import KEYRING, enc_session
+from cookie.core.session_cache import SessionCache
+
+NOW = datetime(2030, 6, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.mono = 1000.0
+        self.wall = NOW
+
+    def monotonic(self) -> float:
+        return self.mono
+
+    def time(self) -> float:
+        return self.wall
+
+    def advance(self, seconds: float) -> None:
+        self.mono += seconds
+        self.wall += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(sc, "time", fake)
+    return fake
+
+
+def _token(n: int) -> str:
+    return KEYRING.primary.kid + "." + base64.b64encode(bytes([n]) * 32).decode()
+
+
+class CountingDecoder:
+    """Decodes raw bytes to a session expiring on `expires`, or fails."""
+
+    def __init__(self, expires: str = "2099-12-31") -> None:
+        self.expires = expires
+        self.calls = 0
+        self.bad: set[bytes] = set()
+
+    def __call__(self, key, raw: bytes) -> dict[str, str]:
+        self.calls += 1
+        if raw in self.bad:
+            raise ValueError("bad padding")
+        return {"user": str(raw[0]), "admin": "false", "expires": self.expires}
+
+
+def test_hit_is_served_until_max_age(clock):
+    decode = CountingDecoder()
+    cache = SessionCache(max_age=60, decode=decode)
+
+    assert cache.get(_token(1))["user"] == "1"
+    clock.advance(59)
+    cache.get(_token(1))
+    assert decode.calls == 1
+
+    clock.advance(2)
+    cache.get(_token(1))
+    assert decode.calls == 2
+
+
+def test_ttl_is_capped_by_expires_date(clock):
+    # NOW is 12:00 UTC on 2030-06-01, so the session ends in ~12 hours
+    decode = CountingDecoder(expires="2030-06-01")
+    cache = SessionCache(max_age=24 * 3600, decode=decode)
+
+    cache.get(_token(1))
+    clock.advance(11 * 3600)
+    cache.get(_token(1))
+    assert decode.calls == 1
+
+    clock.advance(3600)
+    cache.get(_token(1))
+    assert decode.calls == 2
+
+
+def test_expired_session_is_not_cached(clock):
+    decode = CountingDecoder(expires="2030-05-31")
+    cache = SessionCache(decode=decode)
+
+    cache.get(_token(1))
+    cache.get(_token(1))
+    assert decode.calls == 2
+
+
+def test_negative_cache_hits_and_expires(clock):
+    decode = CountingDecoder()
+    decode.bad.add(bytes([7]) * 32)
+    cache = SessionCache(negative_ttl=10, decode=decode)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            cache.get(_token(7))
+    assert decode.calls == 1
+
+    clock.advance(11)
+    with pytest.raises(ValueError):
+        cache.get(_token(7))
+    assert decode.calls == 2
+
+
+def test_negative_cache_covers_malformed_tokens(clock):
+    cache = SessionCache(decode=CountingDecoder())
+    for token in ("no-key-id", KEYRING.primary.kid + ".not base64!", "zz.AAAA"):
+        with pytest.raises(ValueError):
+            cache.get(token)
+        assert token in cache._misses
+
+
+def test_lru_evicts_least_recently_used(clock):
+    decode = CountingDecoder()
+    cache = SessionCache(maxsize=2, decode=decode)
+
+    cache.get(_token(1))
+    cache.get(_token(2))
+    cache.get(_token(1))  # 2 is now the oldest
+    cache.get(_token(3))
+    assert decode.calls == 3
+
+    cache.get(_token(1))
+    assert decode.calls == 3
+    cache.get(_token(2))
+    assert decode.calls == 4
+
+
+def test_negative_cache_is_bounded(clock):
+    decode = CountingDecoder()
+    decode.bad.update(bytes([n]) * 32 for n in range(5))
+    cache = SessionCache(negative_maxsize=3, decode=decode)
+
+    for n in range(5):
+        with pytest.raises(ValueError):
+            cache.get(_token(n))
+    assert len(cache._misses) == 3
+    assert _token(0) not in cache._misses
+
+
+def test_oversized_tokens_bypass_both_caches(clock):
+    decode = CountingDecoder()
+    cache = SessionCache(max_token_len=20, decode=decode)
+
+    cache.get(_token(1))
+    cache.get(_token(1))
+    assert decode.calls == 2
+
+    decode.bad.add(bytes([2]) * 32)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.get(_token(2))
+    assert decode.calls == 4
+    assert not cache._hits and not cache._misses
+
+
+def test_real_token_round_trip():
+    cache = SessionCache()
+    token = enc_session("alice")
+    sid, kv = cache.lookup(token)
+    assert kv["user"] == "alice" and kv["admin"] == "false"
+    assert cache.lookup(token) == (sid, kv)
+    cache.discard(sid)
+    assert sid not in cache._hits
@@ -0,0 +1,83 @@
+import http.client
+
+import pytest
+from fastapi.testclient import TestClient
+
+import solver
+from cookie.core import crypto
+from cookie.core.revocation import RevocationList
+from cookie.core.session_cache import SessionCache
+from cookie.main import app
+from cookie.routers import session as session_router
+
+
+def _usable(n: int, block: int = solver.BLOCK) -> bool:
+    start = len(solver.PREFIX) + n
+    block_idx, pos = divmod(start + len(solver.MARKER), block)
+    return pos + len(solver.WANT) <= block and start >= block_idx * block
+
+
+@pytest.mark.parametrize("block", [16, 32])
+def test_pick_name_len_keeps_flip_inside_one_block(block):
+    n = solver.pick_name_len(block)
+    assert solver.NAME_MIN <= n <= solver.NAME_MAX
+    assert _usable(n, block)
+    assert not any(_usable(m, block) for m in range(solver.NAME_MIN, n))
+
+
+def test_pick_name_len_fails_without_a_usable_length():
+    with pytest.raises(ValueError):
+        solver.pick_name_len(block=4)
+
+
+@pytest.mark.parametrize("quote", ["", '"'])
+def test_forge_cookie_flips_admin_on_kid_tokens(quote):
+    name = "A" * solver.pick_name_len()
+    token = crypto.enc_session(name)
+    kid = token.partition(".")[0]
+
+    forged = solver.forge_cookie(f"{quote}{token}{quote}", len(name))
+
+    assert forged.startswith(kid + ".")
+    assert crypto.load_session_fast(forged)["admin"] == "true"
+
+
+def test_forge_cookie_rejects_misaligned_name():
+    name = "A" * 16  # 'false' would straddle a block boundary
+    with pytest.raises(ValueError):
+        solver.forge_cookie(crypto.enc_session(name), len(name))
+
+
+class _AppClient:
+    """KeepAliveClient stand-in that talks to the app in process."""
+
+    def __init__(self) -> None:
+        self.app = TestClient(app)
+        self.requests = 0
+        self.closed = 0
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests += 1
+        self.app.cookies.clear()
+        resp = self.app.request(method, path, content=body, headers=headers or {})
+        message = http.client.HTTPMessage()
+        for key, value in resp.headers.multi_items():
+            message[key] = value
+        return resp.status_code, message, resp.content
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+def test_check_target_reuses_the_callers_client(monkeypatch):
+    monkeypatch.setattr(session_router, "revocations", RevocationList())
+    monkeypatch.setattr(session_router, "session_cache", SessionCache())
+    client = _AppClient()
+
+    for _ in range(3):
+        result = solver.check_target("http://cookie", 1.0, 1, client)
+        assert result["ok"], result
+        assert result["flag"]
+
+    assert client.requests == 6
+    assert client.closed == 0